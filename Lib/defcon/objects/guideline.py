@@ -5,6 +5,24 @@ from defcon.objects.color import Color
 from defcon.tools.identifiers import makeRandomIdentifier
 
 
+def _attributeProperty(key, notificationName, doc=None):
+    """
+    Make a property that stores its value under **key** and
+    posts **notificationName** when the value changes.
+    """
+    def getter(self):
+        return self.get(key)
+
+    def setter(self, value):
+        old = self.get(key)
+        if value == old:
+            return
+        self[key] = value
+        self.postNotification(notificationName, data=dict(oldValue=old, newValue=value))
+
+    return property(getter, setter, doc=doc)
+
+
 class Guideline(BaseDictObject):
 
     """
@@ -127,59 +145,19 @@ class Guideline(BaseDictObject):
 
     # x
 
-    def _get_x(self):
-        return self.get("x")
-
-    def _set_x(self, value):
-        old = self.get("x")
-        if value == old:
-            return
-        self["x"] = value
-        self.postNotification("Guideline.XChanged", data=dict(oldValue=old, newValue=value))
-
-    x = property(_get_x, _set_x, doc="The x coordinate. Setting this will post *Guideline.XChanged* and *Guideline.Changed* notifications.")
+    x = _attributeProperty("x", "Guideline.XChanged", doc="The x coordinate. Setting this will post *Guideline.XChanged* and *Guideline.Changed* notifications.")
 
     # y
 
-    def _get_y(self):
-        return self.get("y")
-
-    def _set_y(self, value):
-        old = self.get("y")
-        if value == old:
-            return
-        self["y"] = value
-        self.postNotification("Guideline.YChanged", data=dict(oldValue=old, newValue=value))
-
-    y = property(_get_y, _set_y, doc="The y coordinate. Setting this will post *Guideline.YChanged* and *Guideline.Changed* notifications.")
+    y = _attributeProperty("y", "Guideline.YChanged", doc="The y coordinate. Setting this will post *Guideline.YChanged* and *Guideline.Changed* notifications.")
 
     # angle
 
-    def _get_angle(self):
-        return self.get("angle")
-
-    def _set_angle(self, value):
-        old = self.get("angle")
-        if value == old:
-            return
-        self["angle"] = value
-        self.postNotification("Guideline.AngleChanged", data=dict(oldValue=old, newValue=value))
-
-    angle = property(_get_angle, _set_angle, doc="The angle. Setting this will post *Guideline.AngleChanged* and *Guideline.Changed* notifications.")
+    angle = _attributeProperty("angle", "Guideline.AngleChanged", doc="The angle. Setting this will post *Guideline.AngleChanged* and *Guideline.Changed* notifications.")
 
     # name
 
-    def _get_name(self):
-        return self.get("name")
-
-    def _set_name(self, value):
-        old = self.get("name")
-        if value == old:
-            return
-        self["name"] = value
-        self.postNotification("Guideline.NameChanged", data=dict(oldValue=old, newValue=value))
-
-    name = property(_get_name, _set_name, doc="The name. Setting this will post *Guideline.NameChanged* and *Guideline.Changed* notifications.")
+    name = _attributeProperty("name", "Guideline.NameChanged", doc="The name. Setting this will post *Guideline.NameChanged* and *Guideline.Changed* notifications.")
 
     # color
 
@@ -205,9 +183,7 @@ class Guideline(BaseDictObject):
 
     def _get_identifiers(self):
         identifiers = None
-        parent = self.glyph
-        if parent is None:
-            parent = self.font
+        parent = self.getParent()
         if parent is not None:
             identifiers = parent.identifiers
         if identifiers is None:
@@ -221,9 +197,9 @@ class Guideline(BaseDictObject):
 
     def _set_identifier(self, value):
         # don't allow overwritting an existing identifier
-        if self.identifier is not None:
-            return
         oldIdentifier = self.identifier
+        if oldIdentifier is not None:
+            return
         if value == oldIdentifier:
             return
         # don't allow a duplicate
@@ -230,6 +230,15 @@ class BaseDictObjectTest(unittest.TestCase):
         self.assertEqual(self.obj["A"], 1)
         self.assertTrue(self.obj.dirty)
 
+    def test_setItem_same_value(self):
+        self.obj["A"] = 1
+        self.obj.dirty = False
+        self.obj["A"] = 1
+        self.assertFalse(self.obj.dirty)
+        self.obj["A"] = 2
+        self.assertEqual(self.obj["A"], 2)
+        self.assertTrue(self.obj.dirty)
+
     def test_delItem(self):
         self.obj["A"] = 1
         self.obj.dirty = False
@@ -2,12 +2,12 @@
 Contributed by Frederik Berlaen.
 """
 
-from math import sqrt, atan2, radians, degrees
+from math import hypot, atan2, radians, degrees
 
 def _distance(coordinates1, coordinates2):
     (x1, y1) = coordinates1
     (x2, y2) = coordinates2
-    return sqrt((x2 - x1) ** 2 + (y2 - y1) ** 2)
+    return hypot(x2 - x1, y2 - y1)
 
 def joinSegments(onCoords1, offCoords1, offCoords2, onCoords2, offCoords3, offCoords4, onCoords3):
     """